@@ -10,16 +10,28 @@ import subprocess
 import sys
 import json
 import os
-import signal
+import re
 import time
 import csv
+import functools
+import shutil
+import threading
 import pyodbc
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+# Optional imports for system profiling
+try:
+    import numpy as np
+    import psutil
+    PROFILING_AVAILABLE = True
+except ImportError:
+    PROFILING_AVAILABLE = False
+
 # Optional imports for graphing
 try:
-    import pandas as pd
+    import numpy as np
     import matplotlib.pyplot as plt
     import matplotlib.dates as mdates
     GRAPHING_AVAILABLE = True
@@ -31,18 +43,38 @@ JMETER_TEST_PLAN = Path("JMeter_DB_Mixed_Operations.jmx")
 CONFIG_FILE = Path("../../db_config.json")
 JMETER_RESULTS_DIR = Path("jmeter_results")
 
-# Auto-detect best available ODBC driver
-try:
-    import pyodbc as _pyodbc_test
-    available_drivers = _pyodbc_test.drivers()
-    if "ODBC Driver 18 for SQL Server" in available_drivers:
-        DEFAULT_DRIVER = "ODBC Driver 18 for SQL Server"
-    elif "ODBC Driver 17 for SQL Server" in available_drivers:
-        DEFAULT_DRIVER = "ODBC Driver 17 for SQL Server"
-    else:
-        DEFAULT_DRIVER = "SQL Server"
-except:
-    DEFAULT_DRIVER = "ODBC Driver 17 for SQL Server"
+# Resolved once so JMeter is launched directly rather than through a shell
+JMETER_EXE = shutil.which('jmeter.bat' if os.name == 'nt' else 'jmeter')
+
+# One row per system sample: epoch seconds followed by float32 metrics
+PERF_DTYPE = [
+    ('timestamp', 'f8'),
+    ('cpu_percent', 'f4'),
+    ('memory_percent', 'f4'),
+    ('memory_available_mb', 'f4'),
+    ('disk_reads_per_sec', 'f4'),
+    ('disk_writes_per_sec', 'f4'),
+    ('net_bytes_per_sec', 'f4'),
+]
+
+# Matches JMeter's interim ("summary +") and cumulative ("summary =") lines
+SUMMARY_RE = re.compile(r'summary ([+=])(.*)')
+
+
+@functools.cache
+def _detect_driver():
+    """Auto-detect best available ODBC driver (probed once, on first use)"""
+    try:
+        available_drivers = pyodbc.drivers()
+        if "ODBC Driver 18 for SQL Server" in available_drivers:
+            return "ODBC Driver 18 for SQL Server"
+        elif "ODBC Driver 17 for SQL Server" in available_drivers:
+            return "ODBC Driver 17 for SQL Server"
+        else:
+            return "SQL Server"
+    except:
+        return "ODBC Driver 17 for SQL Server"
+
 
 # Color codes for console output
 class Colors:
@@ -54,12 +86,30 @@ class Colors:
     BOLD = '\033[1m'
 
 
+def _enable_vt():
+    """Turn on ANSI escape processing for the Windows console, if it supports it"""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+
+# Windows Terminal, ANSICON and VT-capable consoles all render ANSI colors
+USE_COLOR = (os.name != 'nt'
+             or bool(os.environ.get('WT_SESSION') or os.environ.get('ANSICON'))
+             or _enable_vt())
+
+
 def print_color(text, color=''):
     """Print colored text"""
-    if os.name == 'nt':  # Windows
-        print(text)
-    else:
-        print(f"{color}{text}{Colors.RESET}")
+    print(f"{color}{text}{Colors.RESET}" if USE_COLOR and color else text)
 
 
 def print_header(text):
@@ -73,10 +123,10 @@ def print_header(text):
 def check_jmeter():
     """Check if JMeter is installed and accessible"""
     try:
-        # On Windows, need to use jmeter.bat
-        jmeter_cmd = 'jmeter.bat' if os.name == 'nt' else 'jmeter'
-        result = subprocess.run([jmeter_cmd, '--version'], 
-                              capture_output=True, text=True, timeout=10, shell=True)
+        if JMETER_EXE is None:
+            raise FileNotFoundError('jmeter')
+        result = subprocess.run([JMETER_EXE, '--version'], 
+                              capture_output=True, text=True, timeout=10)
         if result.returncode == 0:
             version_line = result.stdout.split('\n')[0] if result.stdout else "JMeter"
             if "APACHE JMETER" in version_line:
@@ -100,11 +150,17 @@ def check_jmeter():
         return False
 
 
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse a config file; the mtime in the key invalidates stale entries"""
+    return json.loads(Path(path_str).read_bytes())
+
+
 def load_config(config_file: Path = CONFIG_FILE) -> dict:
     """Load database configuration from JSON file"""
     try:
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        config_file = Path(config_file)
+        return _load_config_cached(str(config_file.resolve()), config_file.stat().st_mtime_ns)
     except FileNotFoundError:
         print(f"Error: Configuration file '{config_file}' not found.")
         sys.exit(1)
@@ -133,12 +189,20 @@ def parse_server_config(env_config):
 def build_connection_string(env_config: dict) -> str:
     """Build ODBC connection string from environment config"""
     server, port = parse_server_config(env_config)
-    database = env_config.get('database', '')
-    username = env_config.get('username', '')
-    password = env_config.get('password', '')
-    
+    return _format_connection_string(
+        server,
+        port,
+        env_config.get('database', ''),
+        env_config.get('username', ''),
+        env_config.get('password', ''),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _format_connection_string(server, port, database, username, password) -> str:
+    """Format the ODBC connection string (memoized per distinct environment)"""
     connection_string = (
-        f"DRIVER={{{DEFAULT_DRIVER}}};"
+        f"DRIVER={{{_detect_driver()}}};"
         f"SERVER={server},{port};"
         f"DATABASE={database};"
         f"UID={username};"
@@ -176,26 +240,92 @@ def get_connection_from_config(env_name: str, config_file: Path):
         return None, None
 
 
-def cleanup_database(connection_string):
+def connect_database(connection_string):
+    """Open a connection for explicit-transaction work, raising pyodbc.Error on failure"""
+    conn = pyodbc.connect(connection_string, autocommit=False)
+    conn.timeout = 30
+    return conn
+
+
+def open_connection(connection_string):
+    """Open the single connection shared by cleanup and seeding"""
+    try:
+        return connect_database(connection_string)
+    except pyodbc.Error as e:
+        print_color(f"  ✗ Could not connect to database: {e}", Colors.RED)
+        sys.exit(1)
+
+
+def bulk_insert(cursor, table, columns, rows, label, log=print):
+    """Insert rows with multi-row INSERT ... VALUES statements, retrying row-by-row on integrity errors"""
+    insert_sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+    row_sql = "(" + ", ".join("?" * len(columns)) + ")"
+    
+    # SQL Server allows at most 1000 rows per VALUES list and 2100 parameters per statement
+    chunk_size = min(1000, 2000 // len(columns))
+    
+    # Seeding runs in one transaction, so undo a failed batch to a savepoint
+    # rather than rolling back the rows other seed steps already inserted.
+    # With autocommit off the driver uses implicit transactions, which
+    # SAVE TRANSACTION doesn't start, so read the table first to open one.
+    cursor.execute(f"SELECT TOP (0) 1 FROM {table}")
+    cursor.fetchall()
+    cursor.execute("SELECT @@TRANCOUNT")
+    if cursor.fetchone()[0] == 0:
+        raise RuntimeError(f"No open transaction for the {label} savepoint")
+    cursor.execute("SAVE TRANSACTION bulk_insert")
+    try:
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            params = [value for row in chunk for value in row]
+            cursor.execute(insert_sql + ", ".join([row_sql] * len(chunk)), params)
+        return len(rows)
+    except pyodbc.IntegrityError as e:
+        log(f"  Warning: Batch insert of {label} failed ({str(e)}), retrying row by row")
+        cursor.execute("ROLLBACK TRANSACTION bulk_insert")
+    
+    inserted = 0
+    for row in rows:
+        try:
+            cursor.execute(insert_sql + row_sql, row)
+            inserted += 1
+        except Exception as e:
+            log(f"  Warning: Could not insert {label} {row}: {str(e)}")
+    return inserted
+
+
+def cleanup_database(conn):
     """Clean up database by deleting test records"""
     print("Cleaning up database...")
     
     try:
-        conn = pyodbc.connect(connection_string)
         cursor = conn.cursor()
         
-        # Delete in correct order to respect FK constraints
-        delete_queries = [
-            ("Books", "DELETE FROM [dbo].[Books]"),
-            ("Authors", "DELETE FROM [dbo].[Authors]"),
-            ("Customers", "DELETE FROM [dbo].[Customers]"),
-        ]
+        # Clear in correct order to respect FK constraints
+        tables = ["Books", "Authors", "Customers"]
         
-        for table_name, query in delete_queries:
+        for table_name in tables:
+            # TRUNCATE is minimally logged, but SQL Server refuses it on tables
+            # referenced by a foreign key (e.g. Authors), so fall back to DELETE
             try:
-                cursor.execute(query)
+                cursor.execute(f"TRUNCATE TABLE [dbo].[{table_name}]")
+                print(f"  ✓ Truncated {table_name}")
+                continue
+            except pyodbc.Error as e:
+                print(f"  Warning: Could not truncate {table_name}, deleting instead: {str(e)}")
+            
+            try:
+                cursor.execute(f"DELETE FROM [dbo].[{table_name}]")
                 affected = cursor.rowcount
-                print(f"  ✓ Deleted {affected} records from {table_name}")
+                # DELETE keeps the identity counter, so reseed it to start again
+                # from 1 as TRUNCATE would (skipped if no row was ever inserted,
+                # where RESEED 0 would make the next Id 0)
+                cursor.execute(f"""
+                    IF EXISTS (SELECT 1 FROM sys.identity_columns
+                               WHERE object_id = OBJECT_ID('[dbo].[{table_name}]') AND last_value IS NOT NULL)
+                        DBCC CHECKIDENT ('[dbo].[{table_name}]', RESEED, 0) WITH NO_INFOMSGS;
+                """)
+                print(f"  ✓ Deleted {affected} records from {table_name} and reseeded its identity")
             except Exception as e:
                 print(f"  Warning: Could not delete from {table_name}: {str(e)}")
         
@@ -204,31 +334,80 @@ def cleanup_database(connection_string):
         print()
         
         cursor.close()
-        conn.close()
         
     except Exception as e:
         print(f"  Error during cleanup: {str(e)}")
         print()
 
 
-def seed_database(connection_string):
+def get_row_counts(conn, tables):
+    """Get row counts for dbo tables from partition metadata in a single query"""
+    placeholders = ", ".join("?" * len(tables))
+    cursor = conn.cursor()
+    cursor.execute(f"""
+        SELECT t.name, SUM(p.rows)
+        FROM sys.tables t
+        INNER JOIN sys.partitions p ON t.object_id = p.object_id
+        WHERE p.index_id IN (0, 1)
+            AND t.schema_id = SCHEMA_ID('dbo')
+            AND t.name IN ({placeholders})
+        GROUP BY t.name
+    """, *tables)
+    counts = {name: 0 for name in tables}
+    counts.update({row[0]: int(row[1]) for row in cursor.fetchall()})
+    cursor.close()
+    return counts
+
+
+def seed_in_transaction(conn, seed_steps, log=print):
+    """Run (seed function, existing row count) steps as a single transaction"""
+    conn.execute("SET NOCOUNT ON")
+    try:
+        for seed, existing_count in seed_steps:
+            seed(conn, existing_count, log)
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        log(f"  Warning: Seeding rolled back: {str(e)}")
+        log()
+
+
+def seed_database(conn, connection_string):
     """Seed database with test data"""
     print("Seeding database with test data...")
     
     try:
-        conn = pyodbc.connect(connection_string)
+        row_counts = get_row_counts(conn, ["Authors", "Books", "Customers"])
+    except Exception as e:
+        print(f"  Warning: Could not read table row counts: {str(e)}")
+        print()
+        return
+    
+    # Customers don't reference Authors/Books, so seed them on a second
+    # connection while the Authors -> Books chain runs on the shared one
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        customers_done = executor.submit(seed_customers_on_own_connection,
+                                         connection_string, row_counts["Customers"])
+        seed_in_transaction(conn, [(seed_authors, row_counts["Authors"]),
+                                   (seed_books, row_counts["Books"])])
+        try:
+            for message in customers_done.result():
+                print(message)
+        except pyodbc.Error as e:
+            print(f"  Warning: Could not seed customers: {str(e)}")
+            print()
+
+
+def seed_authors(conn, existing_count, log=print):
+    """Seed database with author records"""
+    log("Seeding Authors table...")
+    
+    try:
         cursor = conn.cursor()
         
-        # Check if authors already exist
-        cursor.execute("SELECT COUNT(*) FROM [dbo].[Authors]")
-        existing_count = cursor.fetchone()[0]
-        
         if existing_count >= 20:
-            print(f"  Authors table already has {existing_count} records. Skipping.")
+            log(f"  Authors table already has {existing_count} records. Skipping.")
             cursor.close()
-            conn.close()
-            seed_books(connection_string)
-            seed_customers(connection_string)
             return
         
         # Seed 20 authors
@@ -239,49 +418,29 @@ def seed_database(connection_string):
             "Barbara Garcia", "Joseph Martinez", "Susan Robinson", "Thomas Clark", "Jessica Rodriguez"
         ]
         
-        inserted = 0
-        for name in authors:
-            try:
-                cursor.execute("""
-                    INSERT INTO [dbo].[Authors] (Name)
-                    VALUES (?)
-                """, name)
-                inserted += 1
-            except Exception as e:
-                print(f"  Warning: Could not insert author {name}: {str(e)}")
+        inserted = bulk_insert(cursor, "[dbo].[Authors]", ["Name"],
+                               [(name,) for name in authors], "author", log)
         
-        cursor.commit()
-        print(f"  ✓ Seeded {inserted} authors successfully!")
-        print()
+        log(f"  ✓ Seeded {inserted} authors successfully!")
+        log()
         
         cursor.close()
-        conn.close()
-        
-        # Seed related data
-        seed_books(connection_string)
-        seed_customers(connection_string)
         
     except Exception as e:
-        print(f"  Warning: Could not seed authors: {str(e)}")
-        print()
+        log(f"  Warning: Could not seed authors: {str(e)}")
+        raise
 
 
-def seed_books(connection_string):
+def seed_books(conn, existing_count, log=print):
     """Seed database with book items"""
-    print("Seeding Books table...")
+    log("Seeding Books table...")
     
     try:
-        conn = pyodbc.connect(connection_string)
         cursor = conn.cursor()
         
-        # Check if books already exist
-        cursor.execute("SELECT COUNT(*) FROM [dbo].[Books]")
-        existing_count = cursor.fetchone()[0]
-        
         if existing_count >= 20:
-            print(f"  Books table already has {existing_count} records. Skipping.")
+            log(f"  Books table already has {existing_count} records. Skipping.")
             cursor.close()
-            conn.close()
             return
         
         # Get existing author IDs
@@ -289,9 +448,8 @@ def seed_books(connection_string):
         author_ids = [row[0] for row in cursor.fetchall()]
         
         if not author_ids:
-            print(f"  Warning: No authors found. Cannot create books.")
+            log(f"  Warning: No authors found. Cannot create books.")
             cursor.close()
-            conn.close()
             return
         
         # Create 2 books per author (40 books total for 20 authors)
@@ -310,54 +468,36 @@ def seed_books(connection_string):
         
         genres = ["Fiction", "Mystery", "Romance", "Sci-Fi", "Horror"]
         
-        inserted = 0
+        books = []
         for i, author_id in enumerate(author_ids[:10]):  # Limit to first 10 authors
             for book_num in range(2):
-                try:
-                    title_idx = (i * 2 + book_num) % len(book_titles)
-                    genre = genres[i % len(genres)]
-                    cursor.execute("""
-                        INSERT INTO [dbo].[Books] 
-                        (Title, AuthorId, Year, Price, Genre)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, 
-                    book_titles[title_idx], 
-                    author_id, 
-                    2020 + i, 
-                    19.99 + (book_num * 5), 
-                    genre)
-                    inserted += 1
-                except Exception as e:
-                    print(f"  Warning: Could not insert book for author {author_id}: {str(e)}")
+                title_idx = (i * 2 + book_num) % len(book_titles)
+                genre = genres[i % len(genres)]
+                books.append((book_titles[title_idx], author_id, 2020 + i, 19.99 + (book_num * 5), genre))
         
-        cursor.commit()
-        print(f"  ✓ Seeded {inserted} books successfully!")
-        print()
+        inserted = bulk_insert(cursor, "[dbo].[Books]",
+                               ["Title", "AuthorId", "Year", "Price", "Genre"], books, "book", log)
+        
+        log(f"  ✓ Seeded {inserted} books successfully!")
+        log()
         
         cursor.close()
-        conn.close()
         
     except Exception as e:
-        print(f"  Warning: Could not seed books: {str(e)}")
-        print()
+        log(f"  Warning: Could not seed books: {str(e)}")
+        raise
 
 
-def seed_customers(connection_string):
+def seed_customers(conn, existing_count, log=print):
     """Seed database with customer records"""
-    print("Seeding Customers table...")
+    log("Seeding Customers table...")
     
     try:
-        conn = pyodbc.connect(connection_string)
         cursor = conn.cursor()
         
-        # Check if customers already exist
-        cursor.execute("SELECT COUNT(*) FROM [dbo].[Customers]")
-        existing_count = cursor.fetchone()[0]
-        
         if existing_count >= 20:
-            print(f"  Customers table already has {existing_count} records. Skipping.")
+            log(f"  Customers table already has {existing_count} records. Skipping.")
             cursor.close()
-            conn.close()
             return
         
         # Seed 20 customers
@@ -384,31 +524,65 @@ def seed_customers(connection_string):
             ("Tina", "Lee", "tina.l@email.com", "Singapore"),
         ]
         
-        inserted = 0
-        for first, last, email, country in customers:
-            try:
-                cursor.execute("""
-                    INSERT INTO [dbo].[Customers] 
-                    (FirstName, LastName, Email, Country)
-                    VALUES (?, ?, ?, ?)
-                """, first, last, email, country)
-                inserted += 1
-            except Exception as e:
-                print(f"  Warning: Could not insert customer {first} {last}: {str(e)}")
+        inserted = bulk_insert(cursor, "[dbo].[Customers]",
+                               ["FirstName", "LastName", "Email", "Country"], customers, "customer", log)
         
-        cursor.commit()
-        print(f"  ✓ Seeded {inserted} customers successfully!")
-        print()
+        log(f"  ✓ Seeded {inserted} customers successfully!")
+        log()
         
         cursor.close()
-        conn.close()
         
     except Exception as e:
-        print(f"  Warning: Could not seed customers: {str(e)}")
-        print()
+        log(f"  Warning: Could not seed customers: {str(e)}")
+        raise
+
+
+def seed_customers_on_own_connection(connection_string, existing_count):
+    """Seed customers on a dedicated connection and return its console messages"""
+    # Runs in a worker thread, so connection errors are raised to seed_database
+    # rather than exiting via open_connection
+    conn = connect_database(connection_string)
+    # Collect output instead of printing it, so it doesn't interleave with the
+    # Authors/Books seeding running at the same time
+    messages = []
+    log = lambda *args: messages.append(" ".join(str(arg) for arg in args))
+    try:
+        seed_in_transaction(conn, [(seed_customers, existing_count)], log)
+        return messages
+    finally:
+        conn.close()
+
+
+def start_report_generation(jtl_file, report_dir):
+    """Generate the JMeter HTML dashboard from a results file in the background"""
+    report_log = jtl_file.with_name(f"report_{jtl_file.stem}.log")
+    try:
+        proc = subprocess.Popen([JMETER_EXE, '-g', str(jtl_file), '-o', str(report_dir),
+                                 '-j', str(report_log)],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        print_color("  ▸ Generating HTML dashboard in the background...", Colors.GREEN)
+        return proc
+    except Exception as e:
+        print_color(f"  ⚠ Could not start HTML report generation: {e}", Colors.YELLOW)
+        return None
+
+
+def write_jmeter_properties(properties_file, properties):
+    """Write JMeter user properties to a file readable only by the current user"""
+    lines = []
+    for key, value in properties.items():
+        value = str(value).replace('\\', '\\\\').replace('\n', '\\n')
+        # Java reads .properties as ISO-8859-1, so escape anything non-ASCII
+        value = ''.join(c if ord(c) < 128 else f"\\u{ord(c):04x}" for c in value)
+        lines.append(f"{key}={value}\n")
+    
+    # Created with 0600 permissions on POSIX so credentials aren't world-readable
+    fd = os.open(properties_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='ascii') as f:
+        f.writelines(lines)
 
 
-def run_jmeter_test(env_config, results_dir, timeout=600):
+def run_jmeter_test(env_config, results_dir, timeout=600, html_report=True):
     """Run JMeter test"""
     print_header("[Step 4/7] Running JMeter Test")
     
@@ -420,13 +594,11 @@ def run_jmeter_test(env_config, results_dir, timeout=600):
     jtl_file = results_dir / f"results_{timestamp}.jtl"
     report_dir = results_dir / f"report_{timestamp}"
     log_file = results_dir / f"jmeter_{timestamp}.log"
+    properties_file = results_dir / f"jmeter_overrides_{timestamp}.properties"
     
     # Parse server and port from config
     server_host, server_port = parse_server_config(env_config)
 
-    # Prepare JMeter command
-    jmeter_cmd = 'jmeter.bat' if os.name == 'nt' else 'jmeter'
-    
     # Build connection properties
     conn_props = []
     if env_config.get('encrypt', False):
@@ -444,30 +616,36 @@ def run_jmeter_test(env_config, results_dir, timeout=600):
         
     conn_props_str = ";".join(conn_props) + ";"
     
+    # Pass connection settings in a properties file (-q) so credentials
+    # don't appear on the command line
+    write_jmeter_properties(properties_file, {
+        'DB_SERVER': server_host,
+        'DB_PORT': server_port,
+        'DB_NAME': env_config['database'],
+        'DB_USER': env_config.get('username') or '',
+        'DB_PASSWORD': env_config.get('password') or '',
+        'DB_CONN_PROPS': conn_props_str,
+    })
+    
     cmd = [
-        jmeter_cmd,
+        JMETER_EXE,
         '-n',  # Non-GUI mode
         '-t', str(JMETER_TEST_PLAN),
         '-l', str(jtl_file),
-        '-e',  # Generate HTML report
-        '-o', str(report_dir),
         '-j', str(log_file),
-        f"-JDB_SERVER={server_host}",
-        f"-JDB_PORT={server_port}",
-        f"-JDB_NAME={env_config['database']}",
-        f"-JDB_USER={env_config.get('username') or ''}",
-        f"-JDB_PASSWORD={env_config.get('password') or ''}",
-        f"-JDB_CONN_PROPS={conn_props_str}"
+        '-q', str(properties_file),
     ]
     
     print(f"  Test Plan: {JMETER_TEST_PLAN}")
     print(f"  Results: {jtl_file}")
-    print(f"  Report: {report_dir}")
+    if html_report:
+        print(f"  Report: {report_dir}")
     print(f"  Timeout: {timeout} seconds")
     print()
     print_color("  Starting JMeter test...", Colors.YELLOW)
     print()
     
+    report_proc = None
     try:
         # Start JMeter process with real-time output
         process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
@@ -477,7 +655,7 @@ def run_jmeter_test(env_config, results_dir, timeout=600):
         print_color("  " + "="*68, Colors.CYAN)
         
         # Monitor output in real-time
-        start_time = time.time()
+        start_time = time.monotonic()
         last_summary = None
         
         while True:
@@ -486,17 +664,15 @@ def run_jmeter_test(env_config, results_dir, timeout=600):
                 break
                 
             # Show summary lines
-            if 'summary +' in line or 'summary =' in line:
-                if 'summary +' in line:
+            summary = SUMMARY_RE.search(line)
+            if summary:
+                summary_part = summary.group(2).strip()
+                if summary.group(1) == '+':
                     # Intermediate summary
-                    summary_part = line.split('summary +')[1].strip()
-                    elapsed = int(time.time() - start_time)
+                    elapsed = int(time.monotonic() - start_time)
                     print(f"  [{elapsed}s] {summary_part}")
-                    last_summary = summary_part
-                elif 'summary =' in line:
-                    # Final summary
-                    summary_part = line.split('summary =')[1].strip()
-                    last_summary = summary_part
+                # Final summary ('summary =') is only kept for the report below
+                last_summary = summary_part
             
             # Show important events
             elif 'Starting' in line and 'thread' in line.lower():
@@ -504,11 +680,7 @@ def run_jmeter_test(env_config, results_dir, timeout=600):
             elif 'Finished' in line and 'thread' in line.lower():
                 pass  # Skip individual thread finish messages
             elif 'Notifying test listeners of end of test' in line:
-                print_color(f"  ▸ Test execution completed, generating reports...", Colors.GREEN)
-            elif 'Generating Dashboard' in line:
-                print_color(f"  ▸ Generating HTML dashboard...", Colors.GREEN)
-            elif 'Dashboard generated' in line:
-                print_color(f"  ▸ Dashboard generation completed", Colors.GREEN)
+                print_color(f"  ▸ Test execution completed", Colors.GREEN)
         
         # Wait for process to complete
         return_code = process.wait(timeout=timeout)
@@ -522,6 +694,11 @@ def run_jmeter_test(env_config, results_dir, timeout=600):
                 print()
                 print_color("  Final Summary:", Colors.CYAN)
                 print(f"    {last_summary}")
+            
+            # Render the dashboard while monitoring shutdown and graphing proceed
+            if html_report and jtl_file.exists():
+                print()
+                report_proc = start_report_generation(jtl_file, report_dir)
         else:
             print_color(f"  ✗ JMeter test failed with return code {return_code}", Colors.RED)
     
@@ -533,153 +710,176 @@ def run_jmeter_test(env_config, results_dir, timeout=600):
             pass
     except Exception as e:
         print_color(f"  ✗ Error running JMeter: {e}", Colors.RED)
+    finally:
+        properties_file.unlink(missing_ok=True)
     
     print()
-    return jtl_file, report_dir
+    return jtl_file, report_dir, report_proc
+
+
+class PerformanceSampler(threading.Thread):
+    """Background thread that samples system metrics with psutil into a numpy array"""
+    
+    def __init__(self, perf_file, interval=1.0, capacity=3600):
+        super().__init__(daemon=True)
+        self.perf_file = perf_file
+        self.interval = interval
+        self.samples = np.zeros(capacity, dtype=PERF_DTYPE)
+        self.count = 0
+        # Guards samples/count so stop() never saves a half-written row
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        psutil.cpu_percent(interval=None)  # First call only primes the counter
+        last_disk = psutil.disk_io_counters()
+        last_net = psutil.net_io_counters()
+        last_time = time.monotonic()
+        deadline = last_time + self.interval
+        
+        while not self._stop_event.wait(max(0, deadline - time.monotonic())):
+            deadline += self.interval
+            now = time.monotonic()
+            elapsed = now - last_time
+            disk = psutil.disk_io_counters()
+            net = psutil.net_io_counters()
+            memory = psutil.virtual_memory()
+            
+            sample = (
+                time.time(),
+                psutil.cpu_percent(interval=None),
+                memory.percent,
+                memory.available / 1024 / 1024,
+                (disk.read_count - last_disk.read_count) / elapsed if disk and last_disk else 0,
+                (disk.write_count - last_disk.write_count) / elapsed if disk and last_disk else 0,
+                ((net.bytes_sent + net.bytes_recv) - (last_net.bytes_sent + last_net.bytes_recv)) / elapsed,
+            )
+            
+            with self._lock:
+                if self.count == len(self.samples):
+                    self.samples = np.resize(self.samples, len(self.samples) * 2)
+                self.samples[self.count] = sample
+                self.count += 1
+            
+            last_disk, last_net, last_time = disk, net, now
+    
+    def stop(self):
+        """Stop sampling and save the collected samples"""
+        self._stop_event.set()
+        self.join(timeout=self.interval * 3)
+        if self.is_alive():
+            print_color("  ⚠ Sampler thread did not stop in time; saving the samples completed so far",
+                        Colors.YELLOW)
+        with self._lock:
+            samples = self.samples[:self.count].copy()
+        np.save(self.perf_file, samples)
+        return len(samples)
 
 
-def start_performance_monitoring(perf_file):
-    """Start Windows performance monitoring"""
+def start_performance_monitoring(perf_file, timeout=1800):
+    """Start system performance monitoring"""
     print_header("[Step 3/7] Starting Performance Monitoring")
     
-    if os.name != 'nt':
-        print_color("  ⚠ Performance monitoring only available on Windows", Colors.YELLOW)
+    if not PROFILING_AVAILABLE:
+        print_color("  ⚠ Profiling libraries not available (install numpy and psutil)", Colors.YELLOW)
+        print()
         return None
     
     try:
-        perf_cmd = ['typeperf',
-            r'\Processor(_Total)\% Processor Time',
-            r'\Memory\Available MBytes',
-            r'\Memory\% Committed Bytes In Use',
-            r'\PhysicalDisk(_Total)\Disk Reads/sec',
-            r'\PhysicalDisk(_Total)\Disk Writes/sec',
-            r'\Network Interface(*)\Bytes Total/sec',
-            '-si', '1',
-            '-o', str(perf_file)
-        ]
-        
-        proc = subprocess.Popen(perf_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        sampler = PerformanceSampler(perf_file, interval=1.0, capacity=timeout + 60)
+        sampler.start()
         print_color("  ✓ Performance monitoring started", Colors.GREEN)
         print(f"    Output file: {perf_file}")
-        print(f"    Process ID: {proc.pid}")
+        print(f"    Sample interval: {sampler.interval:.0f}s")
         print()
-        return proc
+        return sampler
     except Exception as e:
         print_color(f"  ✗ Failed to start monitoring: {e}", Colors.RED)
         print()
         return None
 
 
-def stop_performance_monitoring(proc):
-    """Stop performance monitoring process"""
+def stop_performance_monitoring(sampler):
+    """Stop performance monitoring and save samples"""
     print_header("[Step 5/7] Stopping Performance Monitoring")
     
-    if proc is None:
+    if sampler is None:
         print_color("  ⚠ No monitoring process to stop", Colors.YELLOW)
         print()
         return
     
     try:
-        # Try graceful shutdown first
-        if os.name == 'nt':
-            subprocess.run(['taskkill', '/F', '/PID', str(proc.pid)], 
-                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=3)
-        else:
-            proc.send_signal(signal.SIGINT)
-            proc.wait(timeout=3)
-        print_color("  ✓ Performance monitoring stopped", Colors.GREEN)
-    except subprocess.TimeoutExpired:
-        print_color("  ⚠ Monitoring process timeout, forcing termination", Colors.YELLOW)
-        try:
-            proc.kill()
-            proc.wait(timeout=1)
-        except:
-            pass
-    except KeyboardInterrupt:
-        print_color("  ⚠ Interrupted - forcing process termination", Colors.YELLOW)
-        try:
-            proc.kill()
-        except:
-            pass
-        raise
+        count = sampler.stop()
+        print_color(f"  ✓ Performance monitoring stopped ({count} samples)", Colors.GREEN)
     except Exception as e:
         print_color(f"  ⚠ Error stopping monitoring: {e}", Colors.YELLOW)
-        try:
-            proc.kill()
-        except:
-            pass
     print()
 
 
-def clean_csv(file_path):
-    """Clean Windows typeperf CSV output"""
-    with open(file_path, 'r', encoding='utf-16') as f:
-        lines = f.readlines()
-    
-    # Remove first line (PDH header)
-    if lines and lines[0].startswith('"(PDH-CSV'):
-        lines = lines[1:]
-    
-    clean_file = file_path.with_suffix('.clean.csv')
-    with open(clean_file, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
-    
-    return clean_file
-
-
-def generate_performance_graphs(perf_csv, output_file):
+def generate_performance_graphs(perf_file, output_file):
     """Generate performance graphs"""
     if not GRAPHING_AVAILABLE:
-        print_color("  ⚠ Graphing libraries not available (install pandas and matplotlib)", Colors.YELLOW)
+        print_color("  ⚠ Graphing libraries not available (install numpy and matplotlib)", Colors.YELLOW)
         return
     
     try:
-        df = pd.read_csv(perf_csv)
-        df.columns = df.columns.str.strip('"')
-        df['Timestamp'] = pd.to_datetime(df.iloc[:, 0], format='%m/%d/%Y %H:%M:%S.%f')
+        data = np.load(perf_file)
+        if len(data) == 0:
+            print_color("  ⚠ No performance samples collected", Colors.YELLOW)
+            return
+        
+        # Downsample long runs to ~600 points per series; averages still use every sample
+        step = len(data) // 600
+        if step > 1:
+            usable = len(data) - len(data) % step
+            plot_data = {name: data[name][:usable].reshape(-1, step).mean(axis=1)
+                         for name in data.dtype.names}
+        else:
+            plot_data = {name: data[name] for name in data.dtype.names}
+        timestamps = [datetime.fromtimestamp(ts) for ts in plot_data['timestamp']]
+        show_fill = len(timestamps) <= 200
+        plt.rcParams['agg.path.chunksize'] = 10000
         
         fig, axes = plt.subplots(2, 2, figsize=(15, 10))
         fig.suptitle('System Performance During Test', fontsize=16)
         
         # CPU Usage
-        cpu_col = [col for col in df.columns if 'Processor Time' in col][0]
-        axes[0, 0].plot(df['Timestamp'], df[cpu_col], label='CPU Usage', color='blue')
-        axes[0, 0].axhline(y=df[cpu_col].mean(), color='r', linestyle='--', label=f'Avg: {df[cpu_col].mean():.1f}%')
-        axes[0, 0].fill_between(df['Timestamp'], df[cpu_col], alpha=0.3)
+        cpu_avg = data['cpu_percent'].mean()
+        axes[0, 0].plot(timestamps, plot_data['cpu_percent'], label='CPU Usage', color='blue')
+        axes[0, 0].axhline(y=cpu_avg, color='r', linestyle='--', label=f'Avg: {cpu_avg:.1f}%')
+        if show_fill:
+            axes[0, 0].fill_between(timestamps, plot_data['cpu_percent'], alpha=0.3)
         axes[0, 0].set_ylabel('CPU %')
         axes[0, 0].set_title('CPU Usage')
         axes[0, 0].legend()
         axes[0, 0].grid(True)
         
         # Memory Usage
-        mem_col = [col for col in df.columns if 'Committed Bytes In Use' in col][0]
-        axes[0, 1].plot(df['Timestamp'], df[mem_col], label='Memory Usage', color='green')
-        axes[0, 1].axhline(y=df[mem_col].mean(), color='r', linestyle='--', label=f'Avg: {df[mem_col].mean():.1f}%')
-        axes[0, 1].fill_between(df['Timestamp'], df[mem_col], alpha=0.3)
+        mem_avg = data['memory_percent'].mean()
+        axes[0, 1].plot(timestamps, plot_data['memory_percent'], label='Memory Usage', color='green')
+        axes[0, 1].axhline(y=mem_avg, color='r', linestyle='--', label=f'Avg: {mem_avg:.1f}%')
+        if show_fill:
+            axes[0, 1].fill_between(timestamps, plot_data['memory_percent'], alpha=0.3)
         axes[0, 1].set_ylabel('Memory %')
         axes[0, 1].set_title('Memory Usage')
         axes[0, 1].legend()
         axes[0, 1].grid(True)
         
         # Disk I/O
-        disk_read = [col for col in df.columns if 'Disk Reads' in col][0]
-        disk_write = [col for col in df.columns if 'Disk Writes' in col][0]
-        axes[1, 0].plot(df['Timestamp'], df[disk_read], label='Reads', color='orange')
-        axes[1, 0].plot(df['Timestamp'], df[disk_write], label='Writes', color='purple')
+        axes[1, 0].plot(timestamps, plot_data['disk_reads_per_sec'], label='Reads', color='orange')
+        axes[1, 0].plot(timestamps, plot_data['disk_writes_per_sec'], label='Writes', color='purple')
         axes[1, 0].set_ylabel('Operations/sec')
         axes[1, 0].set_title('Disk I/O')
         axes[1, 0].legend()
         axes[1, 0].grid(True)
         
         # Network Activity
-        net_cols = [col for col in df.columns if 'Bytes Total/sec' in col]
-        if net_cols:
-            net_data = df[net_cols].sum(axis=1) / 1024 / 1024  # Convert to MB/s
-            axes[1, 1].plot(df['Timestamp'], net_data, label='Network', color='red')
-            axes[1, 1].set_ylabel('MB/s')
-            axes[1, 1].set_title('Network Activity')
-            axes[1, 1].legend()
-            axes[1, 1].grid(True)
+        net_data = plot_data['net_bytes_per_sec'] / 1024 / 1024  # Convert to MB/s
+        axes[1, 1].plot(timestamps, net_data, label='Network', color='red')
+        axes[1, 1].set_ylabel('MB/s')
+        axes[1, 1].set_title('Network Activity')
+        axes[1, 1].legend()
+        axes[1, 1].grid(True)
         
         plt.tight_layout()
         plt.savefig(output_file, dpi=150, bbox_inches='tight')
@@ -699,20 +899,27 @@ def process_performance_data(perf_file, results_dir):
         return
     
     try:
-        clean_file = clean_csv(perf_file)
-        print_color(f"  ✓ Cleaned performance data: {clean_file}", Colors.GREEN)
-        
         graph_file = results_dir / f"performance_graphs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        generate_performance_graphs(clean_file, graph_file)
+        generate_performance_graphs(perf_file, graph_file)
     except Exception as e:
         print_color(f"  ✗ Error processing performance data: {e}", Colors.RED)
     print()
 
 
-def consolidate_results(jtl_file, report_dir, perf_file):
+def consolidate_results(jtl_file, report_dir, perf_file, report_proc=None):
     """Consolidate and display final results"""
     print_header("[Step 7/7] Test Results Summary")
     
+    if report_proc:
+        print("  Waiting for HTML report generation to finish...")
+        try:
+            if report_proc.wait(timeout=300) != 0:
+                print_color(f"  ⚠ HTML report generation failed with return code {report_proc.returncode}", Colors.YELLOW)
+        except subprocess.TimeoutExpired:
+            print_color("  ⚠ HTML report generation timed out", Colors.YELLOW)
+            report_proc.kill()
+        print()
+    
     files_exist = []
     if jtl_file.exists():
         files_exist.append(f"  ✓ JMeter Results: {jtl_file}")
@@ -720,9 +927,6 @@ def consolidate_results(jtl_file, report_dir, perf_file):
         files_exist.append(f"  ✓ HTML Report: {report_dir}/index.html")
     if perf_file and perf_file.exists():
         files_exist.append(f"  ✓ Performance Data: {perf_file}")
-        clean_file = perf_file.with_suffix('.clean.csv')
-        if clean_file.exists():
-            files_exist.append(f"  ✓ Cleaned CSV: {clean_file}")
     
     graph_files = list(JMETER_RESULTS_DIR.glob("performance_graphs_*.png"))
     if graph_files:
@@ -752,6 +956,9 @@ Examples:
   # Skip database seeding (reuse existing data)
   python run_and_monitor_db_test.py --env target --no-seed
   
+  # Skip HTML dashboard generation (quick smoke run)
+  python run_and_monitor_db_test.py --env target --no-html-report
+  
   # Cleanup only
   python run_and_monitor_db_test.py --env target --cleanup
         """)
@@ -768,6 +975,8 @@ Examples:
                        help='Skip database seeding')
     parser.add_argument('--timeout', type=int, default=1800,
                        help='JMeter test timeout in seconds (default: 1800)')
+    parser.add_argument('--no-html-report', action='store_true',
+                       help='Skip JMeter HTML dashboard generation (faster smoke runs)')
     
     args = parser.parse_args()
     
@@ -786,7 +995,11 @@ Examples:
     
     # If cleanup flag is set, run cleanup and exit
     if args.cleanup:
-        cleanup_database(connection_string)
+        conn = open_connection(connection_string)
+        try:
+            cleanup_database(conn)
+        finally:
+            conn.close()
         return
     
     # JMeter execution path
@@ -801,48 +1014,53 @@ Examples:
         sys.exit(1)
     print()
     
-    # Step 2: Cleanup
-    print_header("[Step 2/7] Cleaning Database")
-    cleanup_database(connection_string)
-    print()
-    
-    # Step 3: Seeding (unless skipped)
-    if not args.no_seed:
-        print_header("[Step 2.5/7] Seeding Database")
-        seed_database(connection_string)
+    conn = open_connection(connection_string)
+    try:
+        # Step 2: Cleanup
+        print_header("[Step 2/7] Cleaning Database")
+        cleanup_database(conn)
         print()
+        
+        # Step 3: Seeding (unless skipped)
+        if not args.no_seed:
+            print_header("[Step 2.5/7] Seeding Database")
+            seed_database(conn, connection_string)
+            print()
+    finally:
+        conn.close()
     
     # Setup directories
     JMETER_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
     
     # Performance monitoring (if enabled)
-    perf_proc = None
+    perf_sampler = None
     perf_file = None
-    if not args.no_profiling and os.name == 'nt':
-        perf_file = JMETER_RESULTS_DIR / f"performance_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        perf_proc = start_performance_monitoring(perf_file)
-        time.sleep(2)  # Let monitoring stabilize
+    if not args.no_profiling:
+        perf_file = JMETER_RESULTS_DIR / f"performance_{datetime.now().strftime('%Y%m%d_%H%M%S')}.npy"
+        perf_sampler = start_performance_monitoring(perf_file, timeout=args.timeout)
     
     # Run JMeter test
-    jtl_file, report_dir = run_jmeter_test(env_config, JMETER_RESULTS_DIR, timeout=args.timeout)
+    jtl_file, report_dir, report_proc = run_jmeter_test(env_config, JMETER_RESULTS_DIR, timeout=args.timeout,
+                                                        html_report=not args.no_html_report)
     
     # Stop monitoring
-    if perf_proc:
-        stop_performance_monitoring(perf_proc)
+    if perf_sampler:
+        stop_performance_monitoring(perf_sampler)
     
     # Process performance data
     if perf_file and not args.no_profiling:
         process_performance_data(perf_file, JMETER_RESULTS_DIR)
     
     # Consolidate results
-    consolidate_results(jtl_file, report_dir, perf_file)
+    consolidate_results(jtl_file, report_dir, perf_file, report_proc)
     
     print_color("\n" + "=" * 70, Colors.GREEN)
     print_color("JMETER TEST COMPLETED SUCCESSFULLY!", Colors.GREEN)
     print_color("=" * 70, Colors.GREEN)
     print()
     print(f"Results directory: {JMETER_RESULTS_DIR}")
-    print(f"Open report: {report_dir}/index.html")
+    if not args.no_html_report:
+        print(f"Open report: {report_dir}/index.html")
     print()
 
 
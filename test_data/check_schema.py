@@ -4,6 +4,7 @@ Check database schema structure
 import pyodbc
 import json
 import argparse
+from itertools import groupby
 from pathlib import Path
 
 def load_config(config_path="../db_config.json", env_name="target"):
@@ -46,24 +47,26 @@ def check_schema(env_name="target", config_path="../db_config.json"):
 
         tables = ['Authors', 'Books', 'Genres', 'Customers', 'Rentals', 'Stocks']
 
+        # Fetch the columns of every table in one round-trip
+        placeholders = ", ".join("?" * len(tables))
+        cursor.execute(f"""
+            SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE, CHARACTER_MAXIMUM_LENGTH
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_NAME IN ({placeholders})
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """, *tables)
+        
+        columns_by_table = {table_name: list(rows)
+                            for table_name, rows in groupby(cursor.fetchall(), key=lambda row: row[0])}
+
         for table_name in tables:
             print(f"\n=== {table_name} Table Structure ===")
-            cursor.execute(f"""
-                SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, CHARACTER_MAXIMUM_LENGTH
-                FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_NAME = '{table_name}'
-                ORDER BY ORDINAL_POSITION
-            """)
-            
-            rows = cursor.fetchall()
+            rows = columns_by_table.get(table_name)
             if rows:
                 print(f"  {'Column Name':<30} {'Data Type':<15} {'Nullable':<10} {'Max Length'}")
                 print(f"  {'-'*30} {'-'*15} {'-'*10} {'-'*10}")
-                for row in rows:
-                    col_name = row[0]
-                    data_type = row[1]
-                    nullable = row[2]
-                    max_len = row[3] if row[3] else "N/A"
+                for _, col_name, data_type, nullable, max_len in rows:
+                    max_len = max_len if max_len else "N/A"
                     print(f"  {col_name:<30} {data_type:<15} {nullable:<10} {max_len}")
             else:
                 print(f"  ⚠ Table '{table_name}' not found or has no columns")
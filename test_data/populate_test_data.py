@@ -11,21 +11,73 @@ import pyodbc
 import sys
 from datetime import datetime, timedelta
 import logging
+import logging.handlers
 import random
 import argparse
+import atexit
 import json
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'populate_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 logger = logging.getLogger(__name__)
 
+# Per-row populate loops log progress once every this many rows
+PROGRESS_INTERVAL = 1000
+
+# With --bulk, Authors/Books loads larger than this go through the bcp utility
+BULK_COPY_THRESHOLD = 10000
+
+# Fallback DELETEs remove this many rows per statement, below SQL Server's
+# 5000-lock escalation threshold
+DELETE_BATCH_SIZE = 4000
+
+# Authors/Books loads of at least this many rows are split into batches (at
+# least one per worker, at most PARALLEL_MAX_BATCH_ROWS rows each), which
+# PARALLEL_WORKERS threads take from a shared queue and insert concurrently,
+# each on its own connection
+PARALLEL_THRESHOLD = 1000
+PARALLEL_WORKERS = 4
+PARALLEL_MAX_BATCH_ROWS = 5000
+
+# Per-row Customers INSERT; executing the identical SQL text each iteration
+# lets pyodbc reuse the prepared statement instead of re-preparing it
+INSERT_CUSTOMER_SQL = """
+    INSERT INTO Customers (FirstName, LastName, Email, Country)
+    OUTPUT INSERTED.Id
+    VALUES (?, ?, ?, ?)
+"""
+
+
+def setup_logging():
+    """Log to the console and, through a background thread, to a timestamped log file"""
+    file_handler = logging.FileHandler(f'populate_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    # Buffer log file writes; flush every 512 records, on ERROR, and at exit
+    log_buffer = logging.handlers.MemoryHandler(capacity=512, flushLevel=logging.ERROR, target=file_handler)
+    atexit.register(log_buffer.flush)
+    # File logging only enqueues the record; a background thread does the file
+    # I/O. Console output stays synchronous so it keeps its order with print().
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, log_buffer)
+    log_listener.start()
+    # Registered after the flush so it runs first: the listener drains the
+    # queue into the buffer before the buffer is flushed
+    atexit.register(log_listener.stop)
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[logging.StreamHandler()]
+    )
+    # Added after basicConfig so it keeps the default message-only formatter;
+    # the file handler adds the timestamp and level prefix
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+
 
 def load_config(config_path: str) -> dict:
     """Load configuration from JSON file"""
@@ -75,22 +127,62 @@ def get_connection_from_config(env_name: str, config_path: str = "../db_config.j
     return conn_str
 
 
+def random_int_sql(tag: str) -> str:
+    """T-SQL for a non-negative pseudo-random int per generated row i, distinct per tag"""
+    # NEWID() can't be used here: CHOOSE expands to CASE, which may evaluate
+    # a nondeterministic index once per branch and fall through to NULL
+    return f"(CHECKSUM(HASHBYTES('MD5', CONCAT(@seed, ':{tag}:', i))) & 2147483647)"
+
+
+def random_choice_sql(values: list, tag: str) -> str:
+    """T-SQL picking one of values at random per generated row"""
+    literals = ", ".join("'" + value.replace("'", "''") + "'" for value in values)
+    return f"CHOOSE(1 + {random_int_sql(tag)} % {len(values)}, {literals})"
+
+
 class TestDataPopulator:
     """Manages test data population for BookService database"""
     
-    def __init__(self, connection_string: str, record_count: int, env_name: str = "target"):
+    def __init__(self, connection_string: str, record_count: int, env_name: str = "target",
+                 env_config: dict = None, bulk: bool = False, server_side: bool = False,
+                 bcp_sql_auth: bool = False):
         self.connection_string = connection_string
         self.record_count = record_count
         self.env_name = env_name
+        self.env_config = env_config or {}
+        self.bulk = bulk
+        self.bcp_sql_auth = bcp_sql_auth
+        self.server_side = server_side
         self.timestamp = datetime.now()
+        self._conn = None
+        self._columns = {}
         
     def get_connection(self):
-        """Get database connection"""
+        """Get the database connection, opening it on first use"""
+        if self._conn is not None:
+            return self._conn
         try:
-            return pyodbc.connect(self.connection_string)
+            # Work runs in explicit transactions; NOCOUNT stops per-statement
+            # row count messages being sent back for every insert
+            conn = pyodbc.connect(self.connection_string, autocommit=False)
+            conn.execute("SET NOCOUNT ON")
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
+        self._conn = conn
+        return conn
+    
+    def close(self):
+        """Close the database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def test_connection(self) -> bool:
         """Test database connectivity"""
@@ -99,7 +191,7 @@ class TestDataPopulator:
             cursor = conn.cursor()
             cursor.execute("SELECT @@VERSION")
             version = cursor.fetchone()[0]
-            conn.close()
+            cursor.close()
             logger.info(f" Connected to database successfully")
             logger.info(f"  Database Version: {version[:100]}...")
             return True
@@ -133,6 +225,52 @@ class TestDataPopulator:
             })
         return tables
     
+    def get_table_columns(self, conn, table_names: list) -> dict:
+        """Get column names for several tables in a single query"""
+        cursor = conn.cursor()
+        placeholders = ", ".join("?" * len(table_names))
+        cursor.execute(f"""
+            SELECT TABLE_NAME, COLUMN_NAME
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_NAME IN ({placeholders})
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """, *table_names)
+        
+        columns = {}
+        for row in cursor.fetchall():
+            columns.setdefault(row[0], []).append(row[1])
+        return columns
+    
+    def set_recovery_model(self, model: str) -> str:
+        """Switch the database recovery model and return the previous one"""
+        # ALTER DATABASE can't run inside the populator's open transaction
+        conn = pyodbc.connect(self.connection_string, autocommit=True)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT recovery_model_desc FROM sys.databases WHERE database_id = DB_ID()")
+            previous = cursor.fetchone()[0]
+            if previous != model:
+                cursor.execute(f"ALTER DATABASE CURRENT SET RECOVERY {model}")
+                logger.info(f"Recovery model changed from {previous} to {model}")
+            return previous
+        finally:
+            conn.close()
+    
+    def is_already_populated(self) -> bool:
+        """Check whether Authors/Books/Customers already hold exactly the requested row counts"""
+        cursor = self.get_connection().cursor()
+        try:
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM Authors),
+                    (SELECT COUNT(*) FROM Books),
+                    (SELECT COUNT(*) FROM Customers)
+            """)
+            counts = tuple(cursor.fetchone())
+        finally:
+            cursor.close()
+        return counts == (self.record_count, self.record_count * 2, self.record_count)
+    
     def get_foreign_key_order(self, conn):
         """Get tables in order for deletion (child tables first)"""
         cursor = conn.cursor()
@@ -156,8 +294,50 @@ class TestDataPopulator:
         
         return [(row[0], row[1]) for row in cursor.fetchall()]
     
-    def delete_all_records(self):
-        """Delete all records from all user tables"""
+    def get_foreign_keys(self, conn):
+        """Snapshot every foreign key so it can be dropped and recreated"""
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT 
+                fk.name,
+                ps.name AS ParentSchema,
+                pt.name AS ParentTable,
+                pc.name AS ParentColumn,
+                rs.name AS ReferencedSchema,
+                rt.name AS ReferencedTable,
+                rc.name AS ReferencedColumn,
+                fk.delete_referential_action_desc,
+                fk.update_referential_action_desc
+            FROM sys.foreign_keys fk
+            INNER JOIN sys.foreign_key_columns fkc ON fk.object_id = fkc.constraint_object_id
+            INNER JOIN sys.tables pt ON fkc.parent_object_id = pt.object_id
+            INNER JOIN sys.schemas ps ON pt.schema_id = ps.schema_id
+            INNER JOIN sys.columns pc ON fkc.parent_object_id = pc.object_id
+                AND fkc.parent_column_id = pc.column_id
+            INNER JOIN sys.tables rt ON fkc.referenced_object_id = rt.object_id
+            INNER JOIN sys.schemas rs ON rt.schema_id = rs.schema_id
+            INNER JOIN sys.columns rc ON fkc.referenced_object_id = rc.object_id
+                AND fkc.referenced_column_id = rc.column_id
+            ORDER BY fk.name, fkc.constraint_column_id
+        """)
+        
+        foreign_keys = {}
+        for row in cursor.fetchall():
+            fk = foreign_keys.setdefault(row[0], {
+                'name': row[0],
+                'parent': f"[{row[1]}].[{row[2]}]",
+                'referenced': f"[{row[4]}].[{row[5]}]",
+                'parent_columns': [],
+                'referenced_columns': [],
+                'on_delete': row[7].replace('_', ' '),
+                'on_update': row[8].replace('_', ' ')
+            })
+            fk['parent_columns'].append(f"[{row[3]}]")
+            fk['referenced_columns'].append(f"[{row[6]}]")
+        return list(foreign_keys.values())
+    
+    def delete_all_records(self, commit: bool = True):
+        """Delete all records from all user tables, leaving the transaction open unless commit is set"""
         logger.info("\n" + "="*70)
         logger.info("DELETING ALL RECORDS FROM DATABASE")
         logger.info("="*70)
@@ -171,42 +351,55 @@ class TestDataPopulator:
             
             logger.info(f"Found {len(tables)} tables to clear\n")
             
-            # Disable foreign key constraints for specific tables only
-            logger.info("⚙  Disabling foreign key constraints...")
-            for schema, table_name in tables:
-                try:
-                    cursor.execute(f"ALTER TABLE [{schema}].[{table_name}] NOCHECK CONSTRAINT ALL")
-                except Exception as e:
-                    logger.warning(f"  Could not disable constraints on {schema}.{table_name}: {e}")
-            conn.commit()
+            # TRUNCATE is refused on any table referenced by a foreign key, even a
+            # disabled one, so drop the constraints and recreate them afterwards
+            foreign_keys = self.get_foreign_keys(conn)
+            logger.info(f"⚙  Dropping {len(foreign_keys)} foreign key constraints...")
+            if foreign_keys:
+                cursor.execute(";\n".join(
+                    f"ALTER TABLE {fk['parent']} DROP CONSTRAINT [{fk['name']}]"
+                    for fk in foreign_keys
+                ))
             
-            # Delete from each table
+            # Truncate each table, falling back to DELETE where TRUNCATE isn't allowed
             for schema, table_name in tables:
                 full_table = f"[{schema}].[{table_name}]"
                 try:
-                    # Get current row count
-                    cursor.execute(f"SELECT COUNT(*) FROM {full_table}")
-                    count = cursor.fetchone()[0]
-                    
-                    if count > 0:
-                        # Delete all records
-                        cursor.execute(f"DELETE FROM {full_table}")
-                        conn.commit()
-                        logger.info(f"  Deleted {count:>5} rows from {schema}.{table_name}")
-                    else:
-                        logger.info(f"  Skipped {schema}.{table_name} (already empty)")
-                        
+                    cursor.execute(f"TRUNCATE TABLE {full_table}")
+                    logger.info(f"  Truncated {schema}.{table_name}")
+                    continue
                 except Exception as e:
-                    logger.warning(f"  Could not delete from {schema}.{table_name}: {e}")
-            
-            # Re-enable foreign key constraints for specific tables only
-            logger.info("\n⚙  Re-enabling foreign key constraints...")
-            for schema, table_name in tables:
+                    logger.warning(f"  Could not truncate {schema}.{table_name}, deleting instead: {e}")
+                
                 try:
-                    cursor.execute(f"ALTER TABLE [{schema}].[{table_name}] WITH CHECK CHECK CONSTRAINT ALL")
+                    # Delete in batches (in one round trip) so no single statement
+                    # escalates to a table lock; NOCOUNT is on, so sum @@ROWCOUNT
+                    cursor.execute(f"""
+                        DECLARE @deleted INT = 0, @batch INT = 1;
+                        WHILE @batch > 0
+                        BEGIN
+                            DELETE TOP ({DELETE_BATCH_SIZE}) FROM {full_table};
+                            SET @batch = @@ROWCOUNT;
+                            SET @deleted += @batch;
+                        END;
+                        SELECT @deleted;
+                    """)
+                    logger.info(f"  Deleted {cursor.fetchone()[0]:>5} rows from {schema}.{table_name}")
                 except Exception as e:
-                    logger.warning(f"  Could not re-enable constraints on {schema}.{table_name}: {e}")
-            conn.commit()
+                    logger.warning(f"  Could not delete from {schema}.{table_name}: {e}")
+            
+            # Recreate the foreign keys exactly as they were
+            logger.info(f"\n⚙  Recreating {len(foreign_keys)} foreign key constraints...")
+            if foreign_keys:
+                cursor.execute(";\n".join(
+                    f"ALTER TABLE {fk['parent']} WITH CHECK ADD CONSTRAINT [{fk['name']}] "
+                    f"FOREIGN KEY ({', '.join(fk['parent_columns'])}) "
+                    f"REFERENCES {fk['referenced']} ({', '.join(fk['referenced_columns'])}) "
+                    f"ON DELETE {fk['on_delete']} ON UPDATE {fk['on_update']}"
+                    for fk in foreign_keys
+                ))
+            if commit:
+                conn.commit()
             
             logger.info("="*70)
             logger.info(" All records deleted successfully")
@@ -216,25 +409,246 @@ class TestDataPopulator:
             logger.error(f"Error during deletion: {e}")
             conn.rollback()
             raise
+        finally:
+            cursor.close()
+    
+    def insert_rows(self, cursor, table: str, columns: list, rows: list, label: str) -> list:
+        """Insert rows in multi-row batches and return the new identity Ids"""
+        row_sql = "(" + ", ".join("?" * len(columns)) + ")"
+        
+        # SQL Server allows at most 1000 rows per VALUES list and 2100 parameters per statement
+        batch_size = min(1000, 2000 // len(columns))
+        
+        ids = []
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            # Collect each batch's generated Ids in a table variable and return
+            # them as one result set
+            batch_sql = (
+                "DECLARE @ids TABLE (Id INT);\n"
+                f"INSERT INTO {table} ({', '.join(columns)}) OUTPUT INSERTED.Id INTO @ids\n"
+                f"VALUES {', '.join([row_sql] * len(batch))};\n"
+                "SELECT Id FROM @ids ORDER BY Id;"
+            )
+            try:
+                cursor.execute(batch_sql, [value for row in batch for value in row])
+                ids.extend(row[0] for row in cursor.fetchall())
+            except Exception as e:
+                logger.error(f"   Error creating {label} {start + 1}-{start + len(batch)}: {e}")
+                raise
+            done = start + len(batch)
+            # Log once per PROGRESS_INTERVAL rows crossed, and after the last batch
+            if done // PROGRESS_INTERVAL > start // PROGRESS_INTERVAL or done == len(rows):
+                logger.info("   Created %d/%d %s...", done, len(rows), label)
+        
+        return ids
+    
+    def _insert_worker(self, table: str, columns: list, batches: queue.SimpleQueue, label: str,
+                       failed: threading.Event) -> dict:
+        """Insert batches from the queue on a dedicated connection until it is drained, then commit
+        
+        Stops and rolls back instead of committing once any worker has set failed.
+        """
+        conn = pyodbc.connect(self.connection_string, autocommit=False)
+        ids_by_batch = {}
+        try:
+            conn.execute("SET NOCOUNT ON")
+            cursor = conn.cursor()
+            while not failed.is_set():
+                try:
+                    n, batch = batches.get_nowait()
+                except queue.Empty:
+                    break
+                ids_by_batch[n] = self.insert_rows(cursor, table, columns, batch, f"{label} (batch {n + 1})")
+            if failed.is_set():
+                conn.rollback()
+                return {}
+            conn.commit()
+            return ids_by_batch
+        except Exception:
+            failed.set()
+            conn.rollback()
+            raise
         finally:
             conn.close()
     
+    def insert_rows_parallel(self, conn, table: str, columns: list, rows: list, label: str) -> list:
+        """Insert rows across PARALLEL_WORKERS concurrent connections and return the Ids in row order
+        
+        Each worker commits its own batches. When one fails the others stop
+        and roll back, but any that already committed keep their rows;
+        populate_database clears the tables when that happens.
+        """
+        if len(rows) < PARALLEL_THRESHOLD:
+            return self.insert_rows(conn.cursor(), table, columns, rows, label)
+        
+        # Workers commit on their own sessions; commit our work first so they
+        # can see (and do not block on) the rows written so far
+        conn.commit()
+        
+        # Workers pull the next batch as soon as they finish one, so a slow
+        # connection doesn't hold up a fixed share of the rows; there are at
+        # least as many batches as workers so every worker gets some
+        batch_rows = min(PARALLEL_MAX_BATCH_ROWS, -(-len(rows) // PARALLEL_WORKERS))
+        batches = queue.SimpleQueue()
+        batch_count = 0
+        for start in range(0, len(rows), batch_rows):
+            batches.put((batch_count, rows[start:start + batch_rows]))
+            batch_count += 1
+        workers = min(PARALLEL_WORKERS, batch_count)
+        logger.info(f"   Inserting {len(rows)} {label} in {batch_count} batches on {workers} connections...")
+        
+        ids_by_batch = {}
+        failed = threading.Event()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._insert_worker, table, columns, batches, label, failed)
+                       for _ in range(workers)]
+            for future in as_completed(futures):
+                try:
+                    ids_by_batch.update(future.result())
+                except Exception:
+                    # Also covers a worker that failed to connect
+                    failed.set()
+                    for other in futures:
+                        other.cancel()
+                    raise
+        return [row_id for n in range(batch_count) for row_id in ids_by_batch[n]]
+    
+    def bulk_copy_rows(self, cursor, table: str, columns: list, rows: list) -> list:
+        """Load rows with the bcp utility and return the new identity Ids"""
+        bcp_exe = shutil.which('bcp')
+        if not bcp_exe:
+            raise RuntimeError("bcp utility not found in PATH")
+        # bcp only takes a SQL login password as -P, where any local user can
+        # read it from the process list
+        trusted = self.env_config.get('trusted_connection')
+        if not trusted and not self.bcp_sql_auth:
+            raise RuntimeError("bcp with SQL authentication needs --bcp-sql-auth (the password goes on its command line)")
+        
+        # Map each data file field to its column ordinal in the table
+        cursor.execute("SELECT name, column_id FROM sys.columns WHERE object_id = OBJECT_ID(?)", f"dbo.{table}")
+        column_ids = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        cursor.execute(f"SELECT ISNULL(MAX(Id), 0) FROM {table}")
+        last_id = cursor.fetchone()[0]
+        
+        server = self.env_config.get('server', '')
+        port = self.env_config.get('port', '')
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_file = Path(temp_dir) / f"{table}.dat"
+            format_file = Path(temp_dir) / f"{table}.fmt"
+            
+            with open(data_file, 'w', encoding='utf-8', newline='\n') as f:
+                f.writelines('\t'.join(str(value) for value in row) + '\n' for row in rows)
+            
+            format_lines = ["14.0", str(len(columns))]
+            for i, column in enumerate(columns, start=1):
+                terminator = '\\n' if i == len(columns) else '\\t'
+                format_lines.append(f'{i} SQLCHAR 0 0 "{terminator}" {column_ids[column]} {column} ""')
+            format_file.write_text('\n'.join(format_lines) + '\n', encoding='utf-8')
+            
+            cmd = [bcp_exe, f"dbo.{table}", "in", str(data_file), "-f", str(format_file),
+                   "-S", f"{server},{port}" if port else server,
+                   "-d", self.env_config['database'],
+                   "-b", "50000", "-m", "1", "-u",
+                   "-h", "TABLOCK,CHECK_CONSTRAINTS"]
+            if trusted:
+                cmd.append("-T")
+            else:
+                cmd += ["-U", self.env_config.get('username', ''), "-P", self.env_config.get('password', '')]
+            
+            # bcp loads through its own session, which can only see (and check
+            # foreign keys against) rows this transaction has committed
+            cursor.commit()
+            
+            logger.info(f"   Bulk copying {len(rows)} {table.lower()} with bcp...")
+            result = subprocess.run(cmd, capture_output=True, text=True)
+        
+        cursor.execute(f"SELECT Id FROM {table} WHERE Id > ? ORDER BY Id", last_id)
+        ids = [row[0] for row in cursor.fetchall()]
+        if result.returncode != 0 or len(ids) != len(rows):
+            # bcp commits per batch, so remove a partial load before reporting failure
+            if ids:
+                cursor.execute(f"DELETE FROM {table} WHERE Id > ?", last_id)
+            output = (result.stdout or result.stderr).strip().splitlines()
+            raise RuntimeError(output[-1] if output else f"bcp exited with code {result.returncode}")
+        
+        return ids
+    
+    def load_rows(self, conn, table: str, columns: list, rows: list, label: str) -> list:
+        """Insert rows with bcp when --bulk applies, otherwise with batched inserts"""
+        if self.bulk and len(rows) > BULK_COPY_THRESHOLD:
+            try:
+                return self.bulk_copy_rows(conn.cursor(), table, columns, rows)
+            except Exception as e:
+                logger.warning(f"   Bulk copy failed ({e}), falling back to batched inserts")
+        return self.insert_rows_parallel(conn, table, columns, rows, label)
+    
+    def insert_generated_rows(self, cursor, table: str, columns: list, expressions: list, count: int,
+                              join_sql: str = "", join_params: tuple = ()) -> list:
+        """Generate rows in SQL Server with INSERT ... SELECT and return the new identity Ids
+        
+        Expressions can use the row number i (0..count-1) and suffix, the same
+        timestamp-based identifier unique_suffixes builds client-side.
+        """
+        sql = (
+            "DECLARE @ids TABLE (Id INT);\n"
+            "DECLARE @seed INT = ?, @base DATETIME2(0) = ?, @base_us INT = ?;\n"
+            # Cross joining the catalog three ways yields far more rows than
+            # any count we generate; TOP stops reading once it has enough
+            "WITH n AS (\n"
+            "    SELECT TOP (?) ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) - 1 AS i\n"
+            "    FROM sys.all_objects a CROSS JOIN sys.all_objects b CROSS JOIN sys.all_objects c\n"
+            "), t AS (\n"
+            "    SELECT i, DATEADD(second, CAST(i AS INT), @base) AS ts FROM n\n"
+            "), r AS (\n"
+            "    SELECT i, CONVERT(CHAR(8), ts, 112) + REPLACE(CONVERT(CHAR(8), ts, 108), ':', '') + '.'\n"
+            "        + RIGHT('00000' + CAST((@base_us + i * 1000) % 1000000 AS VARCHAR(7)), 6) AS suffix\n"
+            "    FROM t\n"
+            ")\n"
+            # TABLOCK lets INSERT ... SELECT into the freshly emptied table be
+            # minimally logged under SIMPLE or BULK_LOGGED recovery
+            f"INSERT INTO {table} WITH (TABLOCK) ({', '.join(columns)}) OUTPUT INSERTED.Id INTO @ids\n"
+            f"SELECT {', '.join(expressions)}\n"
+            f"FROM r{join_sql};\n"
+            "SELECT Id FROM @ids ORDER BY Id;"
+        )
+        logger.info(f"   Generating {count} {table.lower()} server-side...")
+        cursor.execute(sql, random.getrandbits(31), self.timestamp.replace(microsecond=0),
+                       self.timestamp.microsecond, count, *join_params)
+        ids = [row[0] for row in cursor.fetchall()]
+        if len(ids) != count:
+            raise RuntimeError(f"Generated {len(ids)} {table.lower()} server-side, expected {count}")
+        return ids
+    
+    def unique_suffixes(self, count: int) -> list:
+        """Timestamp-based identifiers for rows 0..count-1 (run timestamp + i seconds, + i ms)"""
+        # Format the date part once per day and build the time of day with
+        # integer arithmetic instead of a datetime + strftime per row
+        base_date = self.timestamp.date()
+        base_seconds = self.timestamp.hour * 3600 + self.timestamp.minute * 60 + self.timestamp.second
+        base_microseconds = self.timestamp.microsecond
+        date_strs = {}
+        
+        suffixes = []
+        for i in range(count):
+            day, seconds = divmod(base_seconds + i, 86400)
+            date_str = date_strs.get(day)
+            if date_str is None:
+                date_str = date_strs[day] = (base_date + timedelta(days=day)).strftime('%Y%m%d')
+            hours, seconds = divmod(seconds, 3600)
+            minutes, seconds = divmod(seconds, 60)
+            microseconds = (base_microseconds + i * 1000) % 1000000
+            suffixes.append(f"{date_str}{hours:02d}{minutes:02d}{seconds:02d}.{microseconds:06d}")
+        return suffixes
+    
     def populate_authors(self, conn, count: int):
         """Populate Authors table with test data"""
-        cursor = conn.cursor()
-        
         logger.info(f"\n Populating Authors table with {count} records...")
         
-        # Check table structure
-        cursor.execute("""
-            SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE
-            FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_NAME = 'Authors'
-            ORDER BY ORDINAL_POSITION
-        """)
-        
-        columns = [(row[0], row[1], row[2]) for row in cursor.fetchall()]
-        logger.info(f"   Table columns: {', '.join([c[0] for c in columns])}")
+        # Table structure is read once by populate_database
+        logger.info(f"   Table columns: {', '.join(self._columns.get('Authors', []))}")
         
         # Generate and insert authors
         first_names = ['John', 'Jane', 'Michael', 'Sarah', 'David', 'Emma', 'Robert', 'Lisa', 
@@ -246,59 +660,36 @@ class TestDataPopulator:
         nationalities = ['American', 'British', 'Canadian', 'Australian', 'Irish', 'German', 'French', 'Spanish',
                         'Italian', 'Japanese', 'Indian', 'Brazilian']
         
-        author_ids = []
+        if self.server_side:
+            name_sql = (f"{random_choice_sql(first_names, 'first')} + ' ' + "
+                        f"{random_choice_sql(last_names, 'last')} + ' [' + suffix + ']'")
+            author_ids = self.insert_generated_rows(conn.cursor(), "Authors", ["Name"], [name_sql], count)
+            logger.info(f"✓ Created {len(author_ids)} authors successfully")
+            return author_ids
         
-        for i in range(count):
-            # Create unique timestamp-based identifier
-            timestamp_str = (self.timestamp + timedelta(seconds=i)).strftime('%Y%m%d%H%M%S')
-            microseconds = (self.timestamp + timedelta(microseconds=i*1000)).microsecond
-            
-            first_name = random.choice(first_names)
-            last_name = random.choice(last_names)
-            unique_suffix = f"[{timestamp_str}.{microseconds:06d}]"
-            
-            # Generate author name (single Name field)
-            author_name = f"{first_name} {last_name} {unique_suffix}"
-            
-            try:
-                cursor.execute("""
-                    INSERT INTO Authors (Name)
-                    VALUES (?)
-                """, author_name)
-                
-                # Get the inserted ID
-                cursor.execute("SELECT @@IDENTITY")
-                author_id = int(cursor.fetchone()[0])
-                author_ids.append(author_id)
-                
-                if (i + 1) % 10 == 0 or i == count - 1:
-                    logger.info(f"   Created {i + 1}/{count} authors...")
-                    
-            except Exception as e:
-                logger.error(f"   Error creating author {i+1}: {e}")
-                raise
+        # Draw every random pick up front in one call per column
+        first_name_picks = random.choices(first_names, k=count)
+        last_name_picks = random.choices(last_names, k=count)
+        
+        # Create unique timestamp-based identifiers
+        suffixes = self.unique_suffixes(count)
+        
+        # Generate author names (single Name field)
+        rows = [(f"{first_name} {last_name} [{suffix}]",)
+                for first_name, last_name, suffix in zip(first_name_picks, last_name_picks, suffixes)]
+        
+        author_ids = self.load_rows(conn, "Authors", ["Name"], rows, "authors")
         
-        conn.commit()
         logger.info(f"✓ Created {len(author_ids)} authors successfully")
         
         return author_ids
     
     def populate_books(self, conn, author_ids: list, count: int):
         """Populate Books table with test data"""
-        cursor = conn.cursor()
-        
         logger.info(f"\n Populating Books table with {count} records...")
         
-        # Check table structure
-        cursor.execute("""
-            SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE
-            FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_NAME = 'Books'
-            ORDER BY ORDINAL_POSITION
-        """)
-        
-        columns = [(row[0], row[1], row[2]) for row in cursor.fetchall()]
-        logger.info(f"   Table columns: {', '.join([c[0] for c in columns])}")
+        # Table structure is read once by populate_database
+        logger.info(f"   Table columns: {', '.join(self._columns.get('Books', []))}")
         
         # Book title templates
         title_templates = [
@@ -320,42 +711,52 @@ class TestDataPopulator:
                  'Web Development', 'Mobile Apps', 'Security', 'DevOps', 'Testing',
                  'Architecture', 'Design Patterns', 'Algorithms', 'Networks', 'APIs']
         
-        book_ids = []
+        genres = ['Fiction', 'Non-Fiction', 'Science', 'Technology', 'History', 'Biography', 'Mystery', 'Thriller']
         
-        for i in range(count):
-            # Create unique timestamp-based identifier
-            timestamp_str = (self.timestamp + timedelta(seconds=i)).strftime('%Y%m%d%H%M%S')
-            microseconds = (self.timestamp + timedelta(microseconds=i*1000)).microsecond
-            
-            template = random.choice(title_templates)
-            topic = random.choice(topics)
-            title = template.format(topic) + f" [TS:{timestamp_str}.{microseconds:06d}]"
-            
-            # Assign to random author
-            author_id = random.choice(author_ids)
-            year = random.randint(2000, 2026)
+        if self.server_side:
+            expressions = [
+                f"REPLACE({random_choice_sql(title_templates, 'template')}, '{{}}', "
+                f"{random_choice_sql(topics, 'topic')}) + ' [TS:' + suffix + ']'",
+                f"2000 + {random_int_sql('year')} % 27",
+                f"CAST(9.99 + {random_int_sql('price')} % 9001 / 100.0 AS DECIMAL(10, 2))",
+                random_choice_sql(genres, 'genre'),
+                "a.Id"
+            ]
+            # Books go to random authors from this run, numbered 0..n-1 by Id
+            join_sql = (
+                "\nJOIN (SELECT Id, ROW_NUMBER() OVER (ORDER BY Id) - 1 AS k FROM Authors WHERE Id BETWEEN ? AND ?) a"
+                f"\n    ON a.k = {random_int_sql('author')} % ?"
+            )
+            book_ids = self.insert_generated_rows(
+                conn.cursor(), "Books", ["Title", "Year", "Price", "Genre", "AuthorId"], expressions, count,
+                join_sql, (min(author_ids), max(author_ids), len(author_ids)))
+            logger.info(f"✓ Created {len(book_ids)} books successfully")
+            return book_ids
+        
+        # Draw every random pick up front in one call per column; books are
+        # assigned to random authors
+        picks = zip(
+            random.choices(title_templates, k=count),
+            random.choices(topics, k=count),
+            random.choices(author_ids, k=count),
+            random.choices(range(2000, 2027), k=count),
+            random.choices(genres, k=count)
+        )
+        
+        # Create unique timestamp-based identifiers
+        suffixes = self.unique_suffixes(count)
+        
+        rows = []
+        
+        for (template, topic, author_id, year, genre), suffix in zip(picks, suffixes):
+            title = template.format(topic) + f" [TS:{suffix}]"
             price = round(random.uniform(9.99, 99.99), 2)
-            genre = random.choice(['Fiction', 'Non-Fiction', 'Science', 'Technology', 'History', 'Biography', 'Mystery', 'Thriller'])
             
-            try:
-                cursor.execute("""
-                    INSERT INTO Books (Title, Year, Price, Genre, AuthorId)
-                    VALUES (?, ?, ?, ?, ?)
-                """, title, year, price, genre, author_id)
-                
-                # Get the inserted ID
-                cursor.execute("SELECT @@IDENTITY")
-                book_id = int(cursor.fetchone()[0])
-                book_ids.append(book_id)
-                
-                if (i + 1) % 10 == 0 or i == count - 1:
-                    logger.info(f"   Created {i + 1}/{count} books...")
-                    
-            except Exception as e:
-                logger.error(f"   Error creating book {i+1}: {e}")
-                raise
+            rows.append((title, year, price, genre, author_id))
+        
+        columns = ["Title", "Year", "Price", "Genre", "AuthorId"]
+        book_ids = self.load_rows(conn, "Books", columns, rows, "books")
         
-        conn.commit()
         logger.info(f"✓ Created {len(book_ids)} books successfully")
         
         return book_ids
@@ -373,121 +774,50 @@ class TestDataPopulator:
                      'Harris', 'Irving', 'Jackson', 'King', 'Lewis', 'Moore', 'Nelson', 'Owen',
                      'Parker', 'Quinn', 'Reed', 'Scott', 'Turner', 'Underwood', 'Vincent']
         
+        countries = ['USA', 'UK', 'Canada', 'Australia', 'Germany', 'France', 'India', 'Japan']
+        
         customer_ids = []
+        suffixes = self.unique_suffixes(count)
         
-        for i in range(count):
-            timestamp_str = (self.timestamp + timedelta(seconds=i)).strftime('%Y%m%d%H%M%S')
-            microseconds = (self.timestamp + timedelta(microseconds=i*1000)).microsecond
-            
-            first_name = random.choice(first_names)
-            last_name = random.choice(last_names)
-            unique_suffix = f"[{timestamp_str}.{microseconds:06d}]"
+        # Draw every random pick up front in one call per column
+        picks = zip(
+            random.choices(first_names, k=count),
+            random.choices(last_names, k=count),
+            random.choices(countries, k=count),
+            suffixes
+        )
+        
+        for i, (first_name, last_name, country, suffix) in enumerate(picks):
+            unique_suffix = f"[{suffix}]"
             
             email = f"{first_name.lower()}.{last_name.lower()}.{i}@customer.com"
-            country = random.choice(['USA', 'UK', 'Canada', 'Australia', 'Germany', 'France', 'India', 'Japan'])
             
             try:
-                cursor.execute("""
-                    INSERT INTO Customers (FirstName, LastName, Email, Country)
-                    VALUES (?, ?, ?, ?)
-                """, first_name + " " + unique_suffix, last_name, email, country)
-                
-                # Get the inserted ID
-                cursor.execute("SELECT @@IDENTITY")
-                customer_id = int(cursor.fetchone()[0])
+                # OUTPUT returns the new Id in the same round trip; a separate
+                # SELECT @@IDENTITY would also force a re-prepare every row
+                cursor.execute(INSERT_CUSTOMER_SQL, first_name + " " + unique_suffix, last_name, email, country)
+                customer_id = cursor.fetchone()[0]
                 customer_ids.append(customer_id)
                 
-                if (i + 1) % 10 == 0 or i == count - 1:
-                    logger.info(f"   Created {i + 1}/{count} customers...")
+                if (i + 1) % PROGRESS_INTERVAL == 0 or i == count - 1:
+                    logger.info("   Created %d/%d customers...", i + 1, count)
                     
             except Exception as e:
                 logger.error(f"   Error creating customer {i+1}: {e}")
                 raise
         
-        conn.commit()
         logger.info(f"✓ Created {len(customer_ids)} customers successfully")
         
         return customer_ids
     
     # Note: Stocks and Rentals tables not found in current schema - methods removed
     
-    def populate_database(self):
-        """Populate Stocks table with test data"""
-        cursor = conn.cursor()
-        
-        total_stocks = len(book_ids) * copies_per_book
-        logger.info(f"\n Populating Stocks table with {total_stocks} records ({copies_per_book} copies per book)...")
-        
-        stock_ids = []
-        counter = 0
-        
-        for book_id in book_ids:
-            for copy in range(copies_per_book):
-                import uuid
-                unique_key = str(uuid.uuid4())
-                is_available = random.choice([True, True, True, False])  # 75% available
-                
-                try:
-                    cursor.execute("""
-                        INSERT INTO Stocks (BookId, UniqueKey, IsAvailable)
-                        OUTPUT INSERTED.ID
-                        VALUES (?, ?, ?)
-                    """, book_id, unique_key, is_available)
-                    
-                    stock_id = cursor.fetchone()[0]
-                    stock_ids.append(stock_id)
-                    counter += 1
-                    
-                    if counter % 50 == 0 or counter == total_stocks:
-                        logger.info(f"   Created {counter}/{total_stocks} stocks...")
-                        
-                except Exception as e:
-                    logger.error(f"   Error creating stock for book {book_id}: {e}")
-                    raise
-        
-        conn.commit()
-        logger.info(f"✓ Created {len(stock_ids)} stocks successfully")
-        
-        return stock_ids
-    
-    def populate_rentals(self, conn, customer_ids: list, stock_ids: list, rental_count: int):
-        """Populate Rentals table with test data"""
-        cursor = conn.cursor()
-        
-        logger.info(f"\n Populating Rentals table with {rental_count} records...")
-        
-        rental_ids = []
-        statuses = ['Rented', 'Returned', 'Returned', 'Returned', 'Overdue']  # Mixed statuses
-        
-        for i in range(rental_count):
-            customer_id = random.choice(customer_ids)
-            stock_id = random.choice(stock_ids)
-            status = random.choice(statuses)
-            
-            rental_date = datetime.now() - timedelta(days=random.randint(1, 180))
-            returned_date = rental_date + timedelta(days=random.randint(7, 30)) if status == 'Returned' else None
-            
-            try:
-                cursor.execute("""
-                    INSERT INTO Rentals (CustomerId, StockId, RentalDate, ReturnedDate, Status)
-                    OUTPUT INSERTED.ID
-                    VALUES (?, ?, ?, ?, ?)
-                """, customer_id, stock_id, rental_date, returned_date, status)
-                
-                rental_id = cursor.fetchone()[0]
-                rental_ids.append(rental_id)
-                
-                if (i + 1) % 10 == 0 or i == rental_count - 1:
-                    logger.info(f"   Created {i + 1}/{rental_count} rentals...")
-                    
-            except Exception as e:
-                logger.error(f"   Error creating rental {i+1}: {e}")
-                raise
-        
-        conn.commit()
-        logger.info(f"✓ Created {len(rental_ids)} rentals successfully")
-        
-        return rental_ids
+    def commits_in_stages(self) -> bool:
+        """Whether populating commits part-way (parallel inserts or bcp), so it can't share the deletion's transaction"""
+        if self.server_side:
+            return False
+        books_count = self.record_count * 2
+        return books_count >= PARALLEL_THRESHOLD or (self.bulk and books_count > BULK_COPY_THRESHOLD)
     
     def populate_database(self):
         """Main method to populate database with test data"""
@@ -506,6 +836,7 @@ class TestDataPopulator:
             logger.info(f"\nDatabase has {len(tables)} user tables:")
             for table in tables:
                 logger.info(f"  • {table['schema']}.{table['name']} ({table['columns']} columns)")
+            self._columns = self.get_table_columns(conn, ['Authors', 'Books'])
             
             # Populate Authors first (parent table)
             author_ids = self.populate_authors(conn, self.record_count)
@@ -518,6 +849,10 @@ class TestDataPopulator:
             # Populate Customers (independent table)
             customer_ids = self.populate_customers(conn, self.record_count)
             
+            # For loads that stay on this connection, the deletion (left open
+            # by main) and everything above commit together here
+            conn.commit()
+            
             logger.info("\n" + "="*70)
             logger.info("✓ DATABASE POPULATED SUCCESSFULLY")
             logger.info("="*70)
@@ -529,9 +864,15 @@ class TestDataPopulator:
         except Exception as e:
             logger.error(f"\n Error populating database: {e}")
             conn.rollback()
+            if self.commits_in_stages():
+                # Parallel and bcp loads have already committed some rows (and
+                # the deletion), so clear the partial data rather than leave it
+                logger.warning("Removing the partially committed test data...")
+                try:
+                    self.delete_all_records()
+                except Exception as cleanup_error:
+                    logger.error(f"Could not remove partial test data: {cleanup_error}")
             raise
-        finally:
-            conn.close()
     
     def print_summary(self):
         """Print summary of current database state"""
@@ -543,14 +884,25 @@ class TestDataPopulator:
         cursor = conn.cursor()
         
         try:
-            # Get all tables and row counts
+            # Get all tables with row counts (heap/clustered index) and space
+            # reserved by all of their indexes. Catalog views only, so unlike
+            # sys.dm_db_partition_stats this needs no VIEW DATABASE STATE.
             cursor.execute("""
+                WITH space AS (
+                    SELECT p.object_id, SUM(au.total_pages) * 8 AS ReservedKB
+                    FROM sys.partitions p
+                    INNER JOIN sys.allocation_units au
+                        ON au.container_id = CASE au.type WHEN 2 THEN p.partition_id ELSE p.hobt_id END
+                    GROUP BY p.object_id
+                )
                 SELECT 
                     s.name + '.' + t.name AS TableName,
-                    SUM(p.rows) AS RowCnt
+                    SUM(p.rows) AS RowCnt,
+                    ISNULL(MAX(sp.ReservedKB), 0) AS ReservedKB
                 FROM sys.tables t
                 INNER JOIN sys.schemas s ON t.schema_id = s.schema_id
                 INNER JOIN sys.partitions p ON t.object_id = p.object_id
+                LEFT JOIN space sp ON sp.object_id = t.object_id
                 WHERE p.index_id IN (0, 1)
                     AND s.name NOT IN ('sys', 'INFORMATION_SCHEMA')
                     AND t.name NOT IN ('__MigrationHistory')
@@ -559,22 +911,28 @@ class TestDataPopulator:
             """)
             
             total_rows = 0
-            for row in cursor.fetchall():
-                table_name = row[0]
-                row_count = row[1]
+            total_kb = 0
+            lines = []
+            for table_name, row_count, reserved_kb in cursor.fetchall():
                 total_rows += row_count
-                logger.info(f"  {table_name:40} {row_count:>10} rows")
+                total_kb += reserved_kb
+                lines.append(f"  {table_name:40} {row_count:>10} rows {reserved_kb:>10} KB")
             
-            logger.info("=" * 70)
-            logger.info(f"  Total Rows: {total_rows}")
-            logger.info("=" * 70)
+            lines.append("=" * 70)
+            lines.append(f"  Total Rows: {total_rows}")
+            lines.append(f"  Total Reserved: {total_kb} KB")
+            lines.append("=" * 70)
+            # One log record for the whole table instead of one per row
+            logger.info("\n".join(lines))
             
         finally:
-            conn.close()
+            cursor.close()
 
 
 def main():
     """Main entry point"""
+    setup_logging()
+    
     print("""  
            Database Test Data Populator 
            Delete all records and populate with fresh test data 
@@ -597,6 +955,19 @@ Examples:
   
   # Default (without config):
   python populate_test_data.py 25
+  
+  # Large load, copying Authors and Books in with bcp (trusted connection,
+  # or add --bcp-sql-auth to let bcp take the SQL password on its command line):
+  python populate_test_data.py --count 50000 --env target --bulk
+  
+  # Generate Authors and Books on the server instead of sending every row:
+  python populate_test_data.py --count 50000 --env target --server-side
+  
+  # Large server-side load, minimally logged under SIMPLE recovery:
+  python populate_test_data.py --count 50000 --env target --server-side --simple-recovery
+  
+  # Leave the data alone if the row counts already match:
+  python populate_test_data.py --count 25 --env target --skip-if-populated
         """
     )
     
@@ -607,6 +978,18 @@ Examples:
                        help='Environment to populate (default: target)')
     parser.add_argument('--config', type=str, default='../db_config.json',
                        help='Path to config file (default: ../db_config.json)')
+    parser.add_argument('--bulk', action='store_true',
+                       help=f'Load Authors/Books with the bcp utility when creating more than {BULK_COPY_THRESHOLD} rows')
+    parser.add_argument('--bcp-sql-auth', action='store_true',
+                       help='Allow --bulk with SQL authentication; the password is passed to bcp as -P and is '
+                            'visible in the process list (trusted connections use -T instead)')
+    parser.add_argument('--server-side', action='store_true',
+                       help='Generate Authors/Books rows in SQL Server with INSERT ... SELECT instead of sending them')
+    parser.add_argument('--simple-recovery', action='store_true',
+                       help='Switch the database to SIMPLE recovery while populating so bulk loads are '
+                            'minimally logged (restored afterwards; breaks the log backup chain)')
+    parser.add_argument('--skip-if-populated', action='store_true',
+                       help='Exit without deleting anything if the tables already hold the requested row counts')
     
     args = parser.parse_args()
     
@@ -628,84 +1011,112 @@ Examples:
         print(f"\n✗ Error loading configuration: {e}")
         sys.exit(1)
     
-    # Create populator instance
-    populator = TestDataPopulator(connection_string, record_count, args.env)
-    
-    # Print environment info
-    print("="*70)
-    print(f"Environment: {args.env.upper()}")
-    print(f"Database: {env_config['database']}")
-    print(f"Server: {env_config.get('server', 'N/A')}")
-    print(f"Records per table: {record_count}")
-    print("="*70)
-    
-    # Test connection
-    if not populator.test_connection():
-        print("\n✗ Cannot connect to database. Please check configuration.")
+    if args.bulk and not env_config.get('trusted_connection') and not args.bcp_sql_auth:
+        print("\n✗ Error: --bulk with SQL authentication would pass the password to bcp on its command line,")
+        print("  where other local users can read it from the process list.")
+        print("  Use a trusted_connection environment, or add --bcp-sql-auth to accept this.")
         sys.exit(1)
     
-    # Show summary before deletion
-    print("\n" + "="*70)
-    print("CURRENT DATABASE STATE (BEFORE DELETION)")
-    print("="*70)
-    populator.print_summary()
-    
-    # Info about what will happen
-    print("\n" + "="*70)
-    if record_count == 0:
-        print("⚠ WARNING: This will DELETE ALL records (NO new data will be populated)")
-    else:
-        print("⚠ WARNING: This will DELETE ALL records and populate with new data")
-    print("="*70)
-    if record_count > 0:
-        print(f"Will populate with {record_count} new test records per table")
-        print("(Authors: {}, Books: {}, Customers: {})".format(
-            record_count, record_count * 2, record_count))
-    else:
-        print("All records will be DELETED. No new data will be created.")
-    print("="*70 + "\n")
-    
-    try:
-        # Delete all records
-        populator.delete_all_records()
+    # Create populator instance
+    with TestDataPopulator(connection_string, record_count, args.env,
+                           env_config=env_config, bulk=args.bulk,
+                           server_side=args.server_side, bcp_sql_auth=args.bcp_sql_auth) as populator:
+        # Print environment info
+        print("="*70)
+        print(f"Environment: {args.env.upper()}")
+        print(f"Database: {env_config['database']}")
+        print(f"Server: {env_config.get('server', 'N/A')}")
+        print(f"Records per table: {record_count}")
+        print("="*70)
         
-        if record_count > 0:
-            # Populate with new data
-            populator.populate_database()
-            
-            # Show final summary
-            populator.print_summary()
-            
-            print("\n" + "="*70)
-            print("✓ TEST DATA POPULATED SUCCESSFULLY")
-            print("="*70)
-            print(f"\n  Summary:")
-            print(f"    • Environment: {args.env.upper()}")
-            print(f"    • Deleted all existing records")
-            print(f"    • Created {record_count} authors")
-            print(f"    • Created {record_count * 2} books")
-            print(f"    • Created {record_count} customers")
-            print(f"    • All records have unique timestamp-based identifiers")
-            print("="*70)
-        else:
-            # Show final summary after deletion only
-            populator.print_summary()
-            
+        # Test connection
+        if not populator.test_connection():
+            print("\n✗ Cannot connect to database. Please check configuration.")
+            sys.exit(1)
+        
+        # Show summary before deletion
+        print("\n" + "="*70)
+        print("CURRENT DATABASE STATE (BEFORE DELETION)")
+        print("="*70)
+        populator.print_summary()
+        
+        # Optionally treat a re-run with the same --count as having nothing to do
+        if record_count > 0 and args.skip_if_populated and populator.is_already_populated():
             print("\n" + "="*70)
-            print("✓ ALL RECORDS DELETED SUCCESSFULLY")
+            print("✓ DATABASE ALREADY POPULATED")
             print("="*70)
-            print(f"\n  Summary:")
-            print(f"    • Environment: {args.env.upper()}")
-            print(f"    • All existing records have been deleted")
-            print(f"    • No new data was populated")
-            print(f"    • Database is now empty")
+            print(f"  Authors: {record_count}, Books: {record_count * 2}, Customers: {record_count}")
+            print("  Run without --skip-if-populated to delete and repopulate anyway")
             print("="*70)
+            sys.exit(0)
         
-        sys.exit(0)
+        # Info about what will happen
+        print("\n" + "="*70)
+        if record_count == 0:
+            print("⚠ WARNING: This will DELETE ALL records (NO new data will be populated)")
+        else:
+            print("⚠ WARNING: This will DELETE ALL records and populate with new data")
+        print("="*70)
+        if record_count > 0:
+            print(f"Will populate with {record_count} new test records per table")
+            print("(Authors: {}, Books: {}, Customers: {})".format(
+                record_count, record_count * 2, record_count))
+        else:
+            print("All records will be DELETED. No new data will be created.")
+        print("="*70 + "\n")
         
-    except Exception as e:
-        logger.error(f"\n✗ Error: {e}")
-        sys.exit(1)
+        previous_recovery = None
+        try:
+            if args.simple_recovery and record_count > 0:
+                previous_recovery = populator.set_recovery_model('SIMPLE')
+            
+            # Delete all records. When the load stays on one connection,
+            # populate_database commits the deletion together with the new data
+            # (or rolls both back); staged parallel/bcp loads need it committed
+            # first and clear the tables again if they fail.
+            atomic = record_count > 0 and not populator.commits_in_stages()
+            populator.delete_all_records(commit=not atomic)
+            
+            if record_count > 0:
+                # Populate with new data
+                populator.populate_database()
+                
+                # Show final summary
+                populator.print_summary()
+                
+                print("\n" + "="*70)
+                print("✓ TEST DATA POPULATED SUCCESSFULLY")
+                print("="*70)
+                print(f"\n  Summary:")
+                print(f"    • Environment: {args.env.upper()}")
+                print(f"    • Deleted all existing records")
+                print(f"    • Created {record_count} authors")
+                print(f"    • Created {record_count * 2} books")
+                print(f"    • Created {record_count} customers")
+                print(f"    • All records have unique timestamp-based identifiers")
+                print("="*70)
+            else:
+                # Show final summary after deletion only
+                populator.print_summary()
+                
+                print("\n" + "="*70)
+                print("✓ ALL RECORDS DELETED SUCCESSFULLY")
+                print("="*70)
+                print(f"\n  Summary:")
+                print(f"    • Environment: {args.env.upper()}")
+                print(f"    • All existing records have been deleted")
+                print(f"    • No new data was populated")
+                print(f"    • Database is now empty")
+                print("="*70)
+            
+            sys.exit(0)
+            
+        except Exception as e:
+            logger.error(f"\n✗ Error: {e}")
+            sys.exit(1)
+        finally:
+            if previous_recovery and previous_recovery != 'SIMPLE':
+                populator.set_recovery_model(previous_recovery)
 
 
 if __name__ == "__main__":